@@ -1,12 +1,34 @@
 import azure.functions as func
-from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobServiceClient
 import logging
 import os
+import threading
 
 ACCOUNT_NAME = "stduitcampaigns"
 CONTAINER = "purview-assets"
 
+# One client per worker: keeps the HTTP session (and the managed identity
+# token) alive across requests instead of re-authenticating every time.
+_BLOB_SERVICE = None
+_BLOB_SERVICE_LOCK = threading.Lock()
+
+
+def _get_blob_service():
+    global _BLOB_SERVICE
+    if _BLOB_SERVICE is None:
+        with _BLOB_SERVICE_LOCK:
+            if _BLOB_SERVICE is None:
+                # Imported on first use: both SDKs pull in large dependency trees, and
+                # every function in this app shares the worker's cold-start import time.
+                from azure.identity import DefaultAzureCredential
+                from azure.storage.blob import BlobServiceClient
+
+                # Managed Identity
+                _BLOB_SERVICE = BlobServiceClient(
+                    account_url=f"https://{ACCOUNT_NAME}.blob.core.windows.net",
+                    credential=DefaultAzureCredential(),
+                )
+    return _BLOB_SERVICE
+
 def main(req: func.HttpRequest) -> func.HttpResponse:
     lender = req.route_params.get("lender")
     if not lender:
@@ -15,15 +37,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     blob_path = f"{lender}/purview_v1.jpg"
 
     try:
-        # Managed Identity
-        credential = DefaultAzureCredential()
-
-        svc = BlobServiceClient(
-            account_url=f"https://{ACCOUNT_NAME}.blob.core.windows.net",
-            credential=credential,
-        )
-
-        blob = svc.get_blob_client(CONTAINER, blob_path)
+        blob = _get_blob_service().get_blob_client(CONTAINER, blob_path)
         data = blob.download_blob().readall()
 
         return func.HttpResponse(
@@ -34,5 +48,5 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
         )
 
     except Exception as e:
-        logging.error(f"[purview_image] Failed to get {blob_path}: {e}")
+        logging.error("[purview_image] Failed to get %s: %s", blob_path, e)
         return func.HttpResponse("Not found", status_code=404)
@@ -1,32 +1,34 @@
 import os
-import time
 import logging
-import json
 import hashlib
 import re
 from typing import Optional, Dict, Any
 
 import azure.functions as func
 
+from shared.cache import ClockCache
+from shared.config import PUBLIC_BASE_URL
+
 # try to import your shared helper (existing)
 try:
-    from shared.db_access import get_redirect_preview  # expected to return an object/dict
+    # async variant: DAB I/O is awaited on the host's event loop instead of
+    # pinning a thread-pool worker for the whole round-trip
+    from shared.db_access import aget_redirect_preview  # RedirectPreview or None
+    from shared.db_access import get_fallback_config  # fallback_default.json, loaded at import
 except Exception:
-    get_redirect_preview = None
+    aget_redirect_preview = None
+    get_fallback_config = None
 
 # ------------ Config ------------
-DAB_CACHE_TTL = int(os.getenv("PURVIEW_LENDER_CACHE_TTL", "3600"))  # 1 hour default
 PREVIEW_CACHE_TTL = int(os.getenv("PURVIEW_PREVIEW_CACHE_TTL", "300"))  # per-token preview cache
+PREVIEW_CACHE_MAX = int(os.getenv("PURVIEW_PREVIEW_CACHE_MAX", "2048"))  # entries per warm instance
 FUNCTION_HOST = (os.getenv("FUNCTION_HOST") or "").rstrip("/")  # optional override
 # If FUNCTION_HOST is not provided, we'll build it from request headers at runtime.
+_BASE_PREVIEW_URL = PUBLIC_BASE_URL.rstrip("/") + "/p/"  # canonical fallback: _BASE_PREVIEW_URL + token
 
-# Local repo fallback path for lender JSONs (may not exist in Azure, but we try)
-REPO_LENDERS_PATH = os.path.join(os.getcwd(), "redirect_previews", "lenders")
-FALLBACK_JSON = os.path.join(os.getcwd(), "redirect_previews", "fallback_default.json")
-
-# Simple in-memory caches (per warm instance)
-_lender_json_cache: Dict[str, tuple[Dict[str, Any], float]] = {}  # lender -> (json, ts)
-_preview_cache: Dict[str, tuple[Dict[str, Any], float]] = {}  # token -> (preview_dict, ts)
+# Bounded in-memory cache (per warm instance): token -> (html_bytes, etag).
+# This is the only per-token preview cache; DAB rows are cached in shared.db_access
+_preview_cache = ClockCache(PREVIEW_CACHE_MAX, PREVIEW_CACHE_TTL)
 
 # Probe detection
 _PROBE_TOKENS = {"health", "status", "ping"}
@@ -43,44 +45,6 @@ def _normalize_lender(name: str) -> str:
     s = s.replace("-", "_")
     return s or "unknown"
 
-def _now() -> float:
-    return time.time()
-
-def _load_lender_json_from_repo(normalized: str) -> Optional[Dict[str, Any]]:
-    """Try to load lender default JSON from repo at runtime (best-effort)."""
-    try:
-        path = os.path.join(REPO_LENDERS_PATH, f"{normalized}_default.json")
-        if os.path.isfile(path):
-            with open(path, "r", encoding="utf-8") as fh:
-                return json.load(fh)
-    except Exception:
-        logging.debug(f"Could not read lender JSON for {normalized} from repo", exc_info=True)
-    # fallback: try the generic fallback file if present
-    try:
-        if os.path.isfile(FALLBACK_JSON):
-            with open(FALLBACK_JSON, "r", encoding="utf-8") as fh:
-                return json.load(fh)
-    except Exception:
-        logging.debug("Could not read fallback default JSON", exc_info=True)
-    return None
-
-def _get_lender_json(normalized: str) -> Optional[Dict[str, Any]]:
-    """Return lender json cached or load from repo; TTL enforced."""
-    now = _now()
-    entry = _lender_json_cache.get(normalized)
-    if entry:
-        data, ts = entry
-        if now - ts < DAB_CACHE_TTL:
-            return data
-        else:
-            del _lender_json_cache[normalized]
-
-    # load
-    data = _load_lender_json_from_repo(normalized)
-    if data:
-        _lender_json_cache[normalized] = (data, now)
-    return data
-
 def _is_probe_request(token: Optional[str], req: func.HttpRequest) -> bool:
     """Detect obvious health probes or irrelevant calls that should be ignored."""
     if not token:
@@ -110,19 +74,13 @@ def _build_image_endpoint(lender_normalized: str, req: func.HttpRequest) -> str:
 def _hash_preview_token(token: str) -> str:
     return hashlib.sha1(token.encode("utf-8")).hexdigest()
 
-def _cache_preview(token: str, preview: Dict[str, Any]) -> None:
-    _preview_cache[token] = (preview, _now())
+# Cache the rendered page rather than the preview dict, so a hit skips HTML
+# templating, UTF-8 encoding and the ETag hash entirely
+def _cache_preview(token: str, body: bytes, etag: str) -> None:
+    _preview_cache.set(token, (body, etag))
 
-def _get_cached_preview(token: str) -> Optional[Dict[str, Any]]:
-    entry = _preview_cache.get(token)
-    if not entry:
-        return None
-    preview, ts = entry
-    if _now() - ts < PREVIEW_CACHE_TTL:
-        return preview
-    else:
-        del _preview_cache[token]
-        return None
+def _get_cached_preview(token: str) -> Optional[tuple[bytes, str]]:
+    return _preview_cache.get(token)
 
 # HTML builder (keeps minimal and fast) - uses image_url already computed in preview dict
 def _build_html(preview: Dict[str, Any]) -> str:
@@ -176,7 +134,7 @@ def _build_html(preview: Dict[str, Any]) -> str:
 </html>"""
 
 # Main
-def main(req: func.HttpRequest) -> func.HttpResponse:
+async def main(req: func.HttpRequest) -> func.HttpResponse:
     logging.info("PURVIEW-V1 request received")
 
     # get token from route or query
@@ -185,7 +143,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     # Quick probe guard - short-circuit health checks and probes
     if _is_probe_request(token, req):
         # avoid logging heavy traces for probes; return 204 No Content (fast)
-        logging.debug(f"Probe/health hit ignored token={token}")
+        logging.debug("Probe/health hit ignored token=%s", token)
         return func.HttpResponse(status_code=204)
 
     if not token:
@@ -195,21 +153,20 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     # Try preview cache
     cached = _get_cached_preview(token)
     if cached:
-        logging.info(f"PurviewHit token={token} cached=True")
-        html = _build_html(cached)
+        logging.info("PurviewHit token=%s cached=True", token)
+        body, etag = cached
         headers = {"Cache-Control": "public, max-age=60"}  # keep same short caching for messaging platforms
         # support ETag for clients
-        etag = f"\"{_hash_preview_token(token)}\""
         headers["ETag"] = etag
-        return func.HttpResponse(html, status_code=200, mimetype="text/html", headers=headers)
+        return func.HttpResponse(body, status_code=200, mimetype="text/html", headers=headers)
 
-    # Primary: attempt to use shared.db_access.get_redirect_preview if available
+    # Primary: attempt to use shared.db_access.aget_redirect_preview if available
     preview_obj = None
     try:
-        if get_redirect_preview:
-            preview_obj = get_redirect_preview(token)
+        if aget_redirect_preview:
+            preview_obj = await aget_redirect_preview(token)
     except Exception:
-        logging.exception("Error calling shared.get_redirect_preview")
+        logging.exception("Error calling shared.aget_redirect_preview")
 
     # If shared returned a 'RedirectPreview' style object, try to normalize it into dict
     preview: Dict[str, Any] = {}
@@ -237,7 +194,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     if not lender_name:
         # try to fallback to a minimal DAB HTTP call if environment variables available.
         # Avoid implementing raw DAB HTTP here since shared.db_access should already handle it in production.
-        logging.info(f"[Purview] preview has no lender from shared; continuing with fallback data for token={token}")
+        logging.info("[Purview] preview has no lender from shared; continuing with fallback data for token=%s", token)
 
     # Normalize lender and compute image endpoint
     lender_normalized = _normalize_lender(lender_name) if lender_name else None
@@ -250,7 +207,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
             logging.exception("Failed to build image endpoint")
     else:
         # No lender — fallback to fallback_default json if available
-        fallback = _get_lender_json("fallback")
+        fallback = get_fallback_config() if get_fallback_config else None
         if fallback:
             preview.setdefault("title", fallback.get("title"))
             preview.setdefault("description", fallback.get("description"))
@@ -263,17 +220,22 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     preview.setdefault("theme_color", "#111827")
 
     # canonical/target url fallback (from preview or build from token)
-    preview.setdefault("canonical_url", preview.get("target_url") or f"https://r.duitai.in/p/{token}")
+    preview.setdefault("canonical_url", preview.get("target_url") or _BASE_PREVIEW_URL + token)
     preview.setdefault("target_url", preview.get("target_url") or preview.get("canonical_url"))
 
-    # Cache the preview result for quick subsequent loads
-    _cache_preview(token, preview)
-    logging.info(f"PurviewHit token={token} lender={lender_normalized} cached=False")
-
     # Build HTML + ETag + headers
-    html = _build_html(preview)
+    body = _build_html(preview).encode("utf-8")
+    etag = f"\"{_hash_preview_token(token)}\""
+
+    # Cache the rendered page for quick subsequent loads. A fallback page may
+    # come from a DAB transport failure, so let the next request retry it;
+    # unknown tokens are already negatively cached in shared.db_access
+    if preview_obj is not None:
+        _cache_preview(token, body, etag)
+    logging.info("PurviewHit token=%s lender=%s cached=False", token, lender_normalized)
+
     headers = {
         "Cache-Control": "public, max-age=60",
-        "ETag": f"\"{_hash_preview_token(token)}\""
+        "ETag": etag
     }
-    return func.HttpResponse(html, status_code=200, mimetype="text/html", headers=headers)
+    return func.HttpResponse(body, status_code=200, mimetype="text/html", headers=headers)
@@ -0,0 +1,73 @@
+# shared/cache.py
+
+import threading
+import time
+
+# Module-level so tests can swap the cache clock without patching
+# time.monotonic for the whole process
+_monotonic = time.monotonic
+
+
+class _Shard:
+    __slots__ = ("lock", "ring", "hand", "max_size")
+
+    def __init__(self, max_size):
+        self.lock = threading.Lock()
+        self.ring = []   # keys in clock order
+        self.hand = 0
+        self.max_size = max_size
+
+
+class ClockCache:
+    """
+    TTL cache with CLOCK (second-chance) replacement, striped over shards.
+
+    Entries live in one plain dict, so get() is a single unlocked dict lookup
+    plus a reference-bit write (atomic under the GIL). The shards only own the
+    clock rings: set() and eviction lock the shard that owns the key, so
+    concurrent writers rarely contend and readers never do.
+    """
+
+    def __init__(self, max_size, ttl, shards=16):
+        # power of two so the shard index is a mask, not a modulo
+        n = 1 << max(0, shards - 1).bit_length()
+        self.ttl = ttl
+        self._data = {}  # key -> [value, ts, ref_bit]
+        self._mask = n - 1
+        self._shards = [_Shard(max(1, max_size // n)) for _ in range(n)]
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if _monotonic() - entry[1] > self.ttl:
+            # stale slot is reclaimed by the clock hand or the next set()
+            return None
+        entry[2] = 1
+        return entry[0]
+
+    def set(self, key, value):
+        shard = self._shards[hash(key) & self._mask]
+        with shard.lock:
+            if key in self._data:
+                self._data[key] = [value, _monotonic(), 1]
+                return
+
+            if len(shard.ring) < shard.max_size:
+                shard.ring.append(key)
+            else:
+                shard.ring[self._evict(shard)] = key
+            self._data[key] = [value, _monotonic(), 0]
+
+    def _evict(self, shard):
+        """Advance the hand to a slot that is unreferenced or expired; caller holds shard.lock."""
+        now = _monotonic()
+        while True:
+            slot = shard.hand
+            shard.hand = (slot + 1) % len(shard.ring)
+            entry = self._data[shard.ring[slot]]
+            if entry[2] and now - entry[1] <= self.ttl:
+                entry[2] = 0
+                continue
+            del self._data[shard.ring[slot]]
+            return slot
@@ -6,22 +6,53 @@ Fixes:
  - Proper lender JSON loading
  - DAB lookup (no $top)
  - Detailed diagnostic logging
- - TTL lender config caching
+ - Lender configs preloaded once at import (read-only table)
+ - One shared RedirectPreview skeleton per lender, cloned per token
+ - Pooled keep-alive DAB connection (urllib3), warmed at import
+ - Async entry point (aget_redirect_preview) over httpx
 """
 
 import os
+import re
+import string
 import json
+import asyncio
 import logging
 import time
 import ssl
+import mmap
+import random
 import threading
-from urllib import request, error
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, quote
 from pathlib import Path
-from collections import OrderedDict
+from collections import namedtuple
+from dataclasses import replace
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 
-from shared.models import RedirectPreview
+import urllib3
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads  # both accept bytes
+
+try:
+    import httpx
+except ImportError:  # async path falls back to a worker thread
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - needed for http2=True
+    _HTTP2 = True
+except ImportError:  # httpx still works, over HTTP/1.1
+    _HTTP2 = False
+
+from shared.cache import ClockCache
+from shared.models import DabRow, RedirectPreview
 from shared.config import DEFAULT_OG_IMAGE_URL, DEFAULT_THEME_COLOR
 
 # -----------------------------------------------------
@@ -36,11 +67,25 @@ DAB_BASE_URL = os.getenv(
 DAB_REDIRECTS_PATH = os.getenv("DAB_REDIRECTS_PATH", "redirects")
 
 DAB_TIMEOUT = float(os.getenv("DAB_TIMEOUT", "4"))
+DAB_CONNECT_TIMEOUT = float(os.getenv("DAB_CONNECT_TIMEOUT", "1"))
 DAB_RETRIES = int(os.getenv("DAB_RETRIES", "2"))
 DAB_BACKOFF = float(os.getenv("DAB_BACKOFF", "0.25"))
+DAB_POOL_MAXSIZE = int(os.getenv("DAB_POOL_MAXSIZE", "32"))
+DAB_MAX_INFLIGHT = int(os.getenv("DAB_MAX_INFLIGHT", str(DAB_POOL_MAXSIZE)))
+DAB_WARMUP = os.getenv("DAB_WARMUP", "1") != "0"
+
+DAB_CACHE_TTL = int(os.getenv("DAB_CACHE_TTL", "60"))
+DAB_CACHE_MAX = int(os.getenv("DAB_CACHE_MAX", "2048"))
+DAB_MISS_CACHE_TTL = int(os.getenv("DAB_MISS_CACHE_TTL", "10"))
+DAB_MISS_CACHE_MAX = int(os.getenv("DAB_MISS_CACHE_MAX", "2048"))
 
-LENDER_CACHE_TTL = int(os.getenv("LENDER_CACHE_TTL", "3600"))
-LENDER_CACHE_MAX = int(os.getenv("LENDER_CACHE_MAX", "128"))
+# Rows to prefetch per campaign after its first lookup; 0 disables prefetch
+DAB_CAMPAIGN_PREFETCH = int(os.getenv("DAB_CAMPAIGN_PREFETCH", "0"))
+
+# Redirect tokens are short alphanumeric ids (e.g. PCAE7a). Anything else is
+# rejected before any URL or network work, which also keeps the token safe to
+# drop straight into the OData filter.
+_TOKEN_RE = re.compile(r"\A[A-Za-z0-9_-]{1,64}\Z")
 
 # -----------------------------------------------------
 # CRITICAL FIX: Correct Azure mounted ZIP root
@@ -51,153 +96,364 @@ LENDER_CACHE_MAX = int(os.getenv("LENDER_CACHE_MAX", "128"))
 FUNCTION_ROOT = Path(__file__).resolve().parents[1]
 
 LENDER_JSON_DIR = FUNCTION_ROOT / "redirect_previews" / "lenders"
+FALLBACK_JSON_PATH = str(FUNCTION_ROOT / "redirect_previews" / "fallback_default.json")
+
+# Configs above this size are mapped and parsed in place rather than read
+_MMAP_MIN_SIZE = 4096
 
 # -----------------------------------------------------
-# TTL + LRU CACHE
+# CACHES
 # -----------------------------------------------------
 
-class LruTtlCache:
-    def __init__(self, max_size, ttl):
-        self.max_size = max_size
-        self.ttl = ttl
-        self.lock = threading.RLock()
-        self.store = OrderedDict()
-
-    def get(self, key):
-        with self.lock:
-            if key not in self.store:
-                return None
-            val, ts = self.store[key]
-            if time.time() - ts > self.ttl:
-                del self.store[key]
-                return None
-            self.store.move_to_end(key)
-            return val
-
-    def set(self, key, value):
-        with self.lock:
-            if key in self.store:
-                del self.store[key]
-            self.store[key] = (value, time.time())
-            while len(self.store) > self.max_size:
-                self.store.popitem(last=False)
-
-
-_lender_cache = LruTtlCache(LENDER_CACHE_MAX, LENDER_CACHE_TTL)
+# Per-token DAB rows: bots and chat apps expand the same link several times
+# within seconds. Unknown tokens get a shorter negative entry so they cannot
+# hammer DAB, while transport failures are never cached.
+_dab_cache = ClockCache(DAB_CACHE_MAX, DAB_CACHE_TTL)
+_dab_miss_cache = ClockCache(DAB_MISS_CACHE_MAX, DAB_MISS_CACHE_TTL)
 
 # -----------------------------------------------------
-# HELPERS
+# DAB CONNECTION POOL
 # -----------------------------------------------------
 
-def _is_valid_http_url(url: str) -> bool:
-    try:
-        p = urlparse(url)
-        return p.scheme in ("http", "https") and bool(p.netloc)
-    except:
-        return False
+# DAB_BASE_URL is a single fixed host: pin one pool to it instead of
+# opening a fresh TCP + TLS connection for every lookup.
+_DAB_URL = urlparse(DAB_BASE_URL)
+_DAB_ORIGIN = f"{_DAB_URL.scheme}://{_DAB_URL.netloc}"
+_DAB_BASE_PATH = _DAB_URL.path.rstrip("/")
+
+_DAB_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": "duit-purview-v1",
+}
+
+# Built once: loading the CA bundle is the expensive part of a TLS setup, and
+# the context is safe to share across the pool's threads and connections.
+# urllib3-only: it sets ALPN to http/1.1 on every wrap, so the h2 client
+# below needs a context of its own.
+_SSL_CTX = ssl.create_default_context()
+
+def _make_dab_pool(base_url: str):
+    # connection_from_url picks the HTTP or HTTPS pool (and default port) from
+    # the scheme, so a plain-http DAB_BASE_URL keeps working locally
+    return urllib3.connection_from_url(
+        base_url,
+        maxsize=DAB_POOL_MAXSIZE,
+        block=False,
+        retries=False,
+        # fail fast on an unreachable host; DAB_TIMEOUT bounds the response wait
+        timeout=urllib3.Timeout(connect=DAB_CONNECT_TIMEOUT, read=DAB_TIMEOUT),
+        **({"ssl_context": _SSL_CTX} if urlparse(base_url).scheme == "https" else {}),
+    )
 
-def _normalize_lender(name: str) -> str:
-    return name.strip().lower().replace(" ", "_")
 
-def _load_lender_json(lender: str) -> Optional[Dict[str, Any]]:
-    norm = _normalize_lender(lender)
+_DAB_CONN = _make_dab_pool(DAB_BASE_URL)
 
-    cached = _lender_cache.get(norm)
-    if cached is not None:
-        return cached
+# Caps concurrent DAB requests at the pool size, so a spike queues for a warm
+# pooled connection instead of opening (and then discarding) extra sockets.
+_DAB_SEM = threading.BoundedSemaphore(DAB_MAX_INFLIGHT)
 
-    path = LENDER_JSON_DIR / f"{norm}_default.json"
 
-    if not path.exists():
-        logging.warning("[Purview] Missing lender JSON: %s", path)
-        return None
+def _warm_dab_connection() -> None:
+    """Resolve DNS and finish the TLS handshake before the first lookup."""
+    try:
+        _DAB_CONN.urlopen("HEAD", "/", headers=_DAB_HEADERS)
+    except Exception as ex:
+        logging.info("[Purview][DAB] Warm-up failed: %s", ex)
+
+# Async counterpart used by aget_redirect_preview: the worker thread is
+# released while waiting on DAB instead of blocking in urlopen. Built on
+# first use inside the running event loop, so workers that never take the
+# async path pay nothing for it at import. It lives for the life of the
+# worker; its sockets close with the process, as the sync pool's do.
+_ASYNC_CLIENT = None
+_ASYNC_LOOP = None
+_ASYNC_SEM = None  # same DAB_MAX_INFLIGHT cap as _DAB_SEM; h2 streams share one socket
+_WARMUP_TASK = None
+
+
+def _get_async_client():
+    global _ASYNC_CLIENT, _ASYNC_LOOP, _ASYNC_SEM
+    loop = asyncio.get_running_loop()
+    # connections are bound to the loop that opened them
+    if _ASYNC_CLIENT is None or _ASYNC_LOOP is not loop:
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            base_url=_DAB_ORIGIN,
+            headers=_DAB_HEADERS,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(DAB_TIMEOUT, connect=DAB_CONNECT_TIMEOUT),
+            verify=ssl.create_default_context(),
+            http2=_HTTP2,
+        )
+        _ASYNC_LOOP = loop
+        _ASYNC_SEM = asyncio.Semaphore(DAB_MAX_INFLIGHT)
+    return _ASYNC_CLIENT
+
 
+async def _awarm_dab_client() -> None:
+    """Async-client counterpart of _warm_dab_connection."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            _lender_cache.set(norm, data)
-            return data
-    except:
-        logging.exception("[Purview] Failed loading lender JSON: %s", path)
-        return None
+        await _get_async_client().head("/")
+    except Exception as ex:
+        logging.info("[Purview][DAB] Warm-up failed: %s", ex)
+
+
+def _start_warmup() -> None:
+    global _WARMUP_TASK
+    if httpx is None:
+        # lookups run on the urllib3 pool (aget_redirect_preview uses a thread)
+        threading.Thread(target=_warm_dab_connection, name="dab-warmup", daemon=True).start()
+        return
+
+    # The host imports functions on the loop that later runs them: warm the
+    # client the handler uses there. A pending h2 connection is shared, so
+    # an early first request waits on this handshake rather than opening
+    # its own.
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # no loop at import: the first lookup opens the connection
+    _WARMUP_TASK = loop.create_task(_awarm_dab_client())
+
+
+if DAB_WARMUP:
+    _start_warmup()
+
+# -----------------------------------------------------
+# HELPERS
+# -----------------------------------------------------
+
+# scheme http(s) plus a non-empty host, same as the old urlparse check
+_URL_RE = re.compile(r"https?://[^/?#\s]+", re.IGNORECASE)
+
+def _is_valid_http_url(url: str) -> bool:
+    return isinstance(url, str) and _URL_RE.match(url) is not None
+
+# Lower-cases ASCII and maps spaces to "_" in a single C-level pass
+_LENDER_TRANSLATE = str.maketrans(string.ascii_uppercase + " ", string.ascii_lowercase + "_")
+
+@lru_cache(maxsize=256)
+def _normalize_lender(name: str) -> str:
+    return name.strip().translate(_LENDER_TRANSLATE)
+
+# Lender config with defaults already applied, built once at load
+LenderCfg = namedtuple("LenderCfg", "title description image_url theme_color")
+
+def _lender_cfg(data: Dict[str, Any]) -> LenderCfg:
+    # "lender" is the display name; without it stay neutral rather than show
+    # the snake_case file stem to users
+    name = data.get("lender")
+    default_title = f"Your {name} loan preview is ready" if name else "Your loan preview is ready"
+    return LenderCfg(
+        title=data.get("title", default_title),
+        description=data.get("description", ""),
+        image_url=data.get("image_url", DEFAULT_OG_IMAGE_URL),
+        theme_color=data.get("theme_color", DEFAULT_THEME_COLOR),
+    )
+
+def _read_json_file(path: str) -> Any:
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return _json_loads(f.read())
+
+def _lender_skeleton(lender: str) -> Optional[RedirectPreview]:
+    return _LENDER_SKELETON.get(_normalize_lender(lender))
+
+def get_fallback_config() -> Optional[Dict[str, Any]]:
+    """Generic redirect_previews/fallback_default.json, loaded at import."""
+    return _FALLBACK_CONFIG
 
 # -----------------------------------------------------
 # DAB URL BUILDER (NO $top)
 # -----------------------------------------------------
 
-def _build_dab_url_for_token(token: str) -> str:
-    """
-    FINAL WORKING VERSION:
-    - DAB_BASE_URL must include /api
-    - DO NOT start relative path with "/" (urljoin would drop /api)
-    - DAB does NOT support $top → removed
-    """
-    raw_filter = f"token eq '{token}'"
-    encoded_filter = raw_filter.replace(" ", "%20")
+# Constant part of the request target, computed once:
+# - DAB_BASE_URL must include /api (kept as _DAB_BASE_PATH)
+# - DAB does NOT support $top → removed
+_DAB_URL_PREFIX = f"{_DAB_BASE_PATH}/{DAB_REDIRECTS_PATH.strip('/')}?$filter=token%20eq%20%27"
+_DAB_URL_SUFFIX = "%27"
 
-    relative = f"{DAB_REDIRECTS_PATH.strip('/')}?$filter={encoded_filter}"
+_DAB_CAMPAIGN_URL_PREFIX = f"{_DAB_BASE_PATH}/{DAB_REDIRECTS_PATH.strip('/')}?$filter=campaign_id%20eq%20"
 
-    return urljoin(DAB_BASE_URL.rstrip('/') + "/", relative)
+
+def _build_dab_url_for_token(token: str) -> str:
+    """Returns the request target (path + query) on the DAB host.
+
+    The token must already have passed _TOKEN_RE, so it needs no quoting.
+    """
+    return _DAB_URL_PREFIX + token + _DAB_URL_SUFFIX
 
 # -----------------------------------------------------
 # HTTP GET + RETRIES + BODY LOGGING
 # -----------------------------------------------------
 
-def _http_get(url: str) -> Optional[str]:
-    ctx = ssl.create_default_context()
-    req = request.Request(url, method="GET")
-    req.add_header("Accept", "application/json")
-    req.add_header("User-Agent", "duit-purview-v1")
-
+def _http_get(url: str) -> Optional[bytes]:
     try:
-        with request.urlopen(req, timeout=DAB_TIMEOUT, context=ctx) as resp:
-            if resp.status == 200:
-                return resp.read().decode("utf-8")
+        with _DAB_SEM:
+            resp = _DAB_CONN.urlopen("GET", url, headers=_DAB_HEADERS)
+    except Exception as ex:
+        logging.warning("[Purview][DAB] Exception: %s", ex)
+        return None
 
-            body = resp.read().decode("utf-8", errors="ignore")
-            logging.warning("[Purview][DAB] HTTP %d body=%s", resp.status, body)
-            return None
+    if resp.status == 200:
+        return resp.data
+
+    body = resp.data.decode("utf-8", errors="ignore")
+    logging.warning("[Purview][DAB] HTTP %d body=%s", resp.status, body)
+    return None
+
+
+def _backoff_delay(attempt: int) -> float:
+    # full jitter: spreads retries from concurrent instances after a DAB blip
+    return random.uniform(0, DAB_BACKOFF * (2 ** attempt))
+
+
+def _http_get_with_retries(url: str) -> Optional[bytes]:
+    for attempt in range(DAB_RETRIES + 1):
+        body = _http_get(url)
+        if body is not None:
+            return body
+        if attempt < DAB_RETRIES:
+            time.sleep(_backoff_delay(attempt))
+    return None
 
-    except error.HTTPError as he:
-        body = ""
-        try:
-            if he.fp:
-                body = he.fp.read().decode("utf-8", errors="ignore")
-        except:
-            pass
-        logging.warning("[Purview][DAB] HTTPError %s body=%s", he.code, body)
-        return None
 
+async def _ahttp_get(url: str) -> Optional[bytes]:
+    try:
+        client = _get_async_client()
+        async with _ASYNC_SEM:
+            resp = await client.get(url)
     except Exception as ex:
         logging.warning("[Purview][DAB] Exception: %s", ex)
         return None
 
+    if resp.status_code == 200:
+        return resp.content
 
-def _http_get_with_retries(url: str) -> Optional[str]:
+    logging.warning("[Purview][DAB] HTTP %d body=%s", resp.status_code, resp.text)
+    return None
+
+
+async def _ahttp_get_with_retries(url: str) -> Optional[bytes]:
     for attempt in range(DAB_RETRIES + 1):
-        body = _http_get(url)
+        body = await _ahttp_get(url)
         if body is not None:
             return body
         if attempt < DAB_RETRIES:
-            time.sleep(DAB_BACKOFF * (2 ** attempt))
+            await asyncio.sleep(_backoff_delay(attempt))
     return None
 
 # -----------------------------------------------------
 # DAB LOOKUP
 # -----------------------------------------------------
 
-def _dab_lookup(token: str) -> Optional[Dict[str, Any]]:
+class _Flight:
+    """One in-progress DAB fetch that concurrent callers for the same token wait on."""
+    __slots__ = ("done", "row")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.row = None
+
+
+_inflight_lock = threading.Lock()
+_inflight: Dict[str, _Flight] = {}
+
+
+def _dab_lookup(token: str) -> Optional[DabRow]:
+    row = _dab_cache.get(token)
+    if row is not None:
+        return row
+    if _dab_miss_cache.get(token):
+        return None
+
+    # single-flight: during a campaign burst only the first caller per token
+    # goes to DAB; the rest wait for and share its result
+    with _inflight_lock:
+        flight = _inflight.get(token)
+        leader = flight is None
+        if leader:
+            flight = _inflight[token] = _Flight()
+
+    if not leader:
+        # no timeout: the leader's fetch is bounded by the pool timeouts and
+        # retries, and always sets done; giving up early would report a live
+        # token as missing
+        flight.done.wait()
+        return flight.row
+
+    try:
+        flight.row = _fetch_dab_row(token)
+    finally:
+        with _inflight_lock:
+            del _inflight[token]
+        flight.done.set()
+    return flight.row
+
+
+def _fetch_dab_row(token: str) -> Optional[DabRow]:
     url = _build_dab_url_for_token(token)
 
-    logging.error("[Purview][DAB] GET %s", url)
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("[Purview][DAB] GET %s%s", _DAB_ORIGIN, url)
 
-    body = _http_get_with_retries(url)
+    return _remember_dab_row(token, _http_get_with_retries(url))
+
+
+# Async single-flight: callers share one fetch task per token. The host runs
+# async handlers on a single event loop, so no lock is needed.
+_ainflight: Dict[str, "asyncio.Task"] = {}
+
+
+async def _adab_lookup(token: str) -> Optional[DabRow]:
+    row = _dab_cache.get(token)
+    if row is not None:
+        return row
+    if _dab_miss_cache.get(token):
+        return None
+
+    task = _ainflight.get(token)
+    if task is None:
+        task = asyncio.ensure_future(_afetch_dab_row(token))
+        _ainflight[token] = task
+        task.add_done_callback(lambda _: _ainflight.pop(token, None))
+
+    # shield: one caller going away must not cancel the fetch the others await
+    return await asyncio.shield(task)
+
+
+async def _afetch_dab_row(token: str) -> Optional[DabRow]:
+    url = _build_dab_url_for_token(token)
+
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("[Purview][DAB] GET %s%s", _DAB_ORIGIN, url)
+
+    return _remember_dab_row(token, await _ahttp_get_with_retries(url))
+
+
+def _remember_dab_row(token: str, body: Optional[bytes]) -> Optional[DabRow]:
     if not body:
+        # transport failure: leave uncached so the next request retries
         logging.info("[Purview][DAB] No response for token=%s", token)
         return None
 
+    row = _parse_dab_body(token, body)
+    if row is None:
+        _dab_miss_cache.set(token, True)
+    else:
+        _dab_cache.set(token, row)
+        try:
+            _maybe_prefetch_campaign(row.campaign_id)
+        except Exception:
+            # best effort: never fail a lookup that already succeeded
+            logging.exception("[Purview][DAB] Campaign prefetch failed for token=%s", token)
+    return row
+
+
+def _parse_dab_body(token: str, body: bytes) -> Optional[DabRow]:
     try:
-        payload = json.loads(body)
+        payload = _json_loads(body)
     except:
         logging.exception("[Purview][DAB] Invalid JSON for token=%s", token)
         return None
@@ -222,58 +478,208 @@ def _dab_lookup(token: str) -> Optional[Dict[str, Any]]:
         logging.warning("[Purview][DAB] Missing lender for %s", token)
         return None
 
-    return {
-        "destination_url": dest,
-        "lender": lender,
-        "mobile": mobile,
-        "campaign_id": campaign_id,
-    }
+    return DabRow(
+        destination_url=dest,
+        lender=lender,
+        mobile=mobile,
+        campaign_id=campaign_id,
+    )
+
+# -----------------------------------------------------
+# CAMPAIGN PREFETCH
+# -----------------------------------------------------
+
+# A campaign blast sends many tokens that are all opened within minutes. After
+# the first lookup for a campaign, fetch a page of its rows in one request and
+# seed the token cache, instead of one DAB round-trip per token.
+_prefetched_campaigns = ClockCache(256, DAB_CACHE_TTL)
+
+
+def _maybe_prefetch_campaign(campaign_id) -> None:
+    if not DAB_CAMPAIGN_PREFETCH:
+        return
+    # only plain OData literals; anything else (list, object) is not a key
+    if isinstance(campaign_id, bool) or not isinstance(campaign_id, (str, int)):
+        return
+    if _prefetched_campaigns.get(campaign_id):
+        return
+
+    _prefetched_campaigns.set(campaign_id, True)
+    threading.Thread(
+        target=_prefetch_campaign, args=(campaign_id,), name="dab-prefetch", daemon=True
+    ).start()
+
+
+def _build_dab_url_for_campaign(campaign_id) -> str:
+    if isinstance(campaign_id, int):
+        literal = str(campaign_id)
+    else:
+        # OData escapes a quote inside a string literal by doubling it
+        literal = "%27" + quote(str(campaign_id).replace("'", "''"), safe="") + "%27"
+    return f"{_DAB_CAMPAIGN_URL_PREFIX}{literal}&$first={DAB_CAMPAIGN_PREFETCH}"
+
+
+def _prefetch_campaign(campaign_id) -> None:
+    body = _http_get(_build_dab_url_for_campaign(campaign_id))
+    if not body:
+        return
+
+    try:
+        rows = _json_loads(body).get("value") or []
+    except:
+        logging.warning("[Purview][DAB] Invalid prefetch JSON for campaign=%s", campaign_id)
+        return
+
+    seeded = 0
+    for raw in rows:
+        if not isinstance(raw, dict):
+            continue
+        token = raw.get("token")
+        dest = raw.get("destination_url")
+        lender = raw.get("lender")
+        if not isinstance(token, str) or not _TOKEN_RE.match(token):
+            continue
+        if not lender or not _is_valid_http_url(dest):
+            continue
+        if _dab_cache.get(token) is None:
+            _dab_cache.set(token, DabRow(dest, lender, raw.get("mobile"), raw.get("campaign_id")))
+            seeded += 1
+
+    logging.info("[Purview][DAB] Prefetched campaign=%s rows=%d", campaign_id, seeded)
 
 # -----------------------------------------------------
 # PUBLIC ENTRY
 # -----------------------------------------------------
 
-def get_redirect_preview(token: Optional[str]) -> Optional[RedirectPreview]:
+# Static half of the preview used when a lender has no config; only the
+# per-token fields are filled in per request.
+_DEFAULT_TEMPLATE = RedirectPreview(
+    token="",
+    title="Your loan preview is ready",
+    description="Tap to view your personalised loan offer.",
+    image_url=DEFAULT_OG_IMAGE_URL,
+    theme_color=DEFAULT_THEME_COLOR,
+    target_url="",
+    canonical_url="",
+)
+
+
+def _clean_token(token: Optional[str]) -> Optional[str]:
     if not token:
         return None
 
     token = token.strip()
-    if not token:
+    if not _TOKEN_RE.match(token):
         return None
 
-    row = _dab_lookup(token)
-    if not row:
-        return None
+    return token
 
-    dest = row["destination_url"]
-    lender = row["lender"]
-    mobile = row.get("mobile")
-    campaign_id = row.get("campaign_id")
 
-    cfg = _load_lender_json(lender)
-    cached = bool(cfg)
+def _build_preview(token: str, row: DabRow) -> RedirectPreview:
+    dest = row.destination_url
+    lender = row.lender
+    mobile = row.mobile
+    campaign_id = row.campaign_id
+
+    skel = _lender_skeleton(lender)
+    cached = skel is not None
 
     logging.info("PurviewHit token=%s lender=%s cached=%s", token, lender, cached)
 
-    if not cfg:
-        return RedirectPreview(
+    if skel is None:
+        return replace(
+            _DEFAULT_TEMPLATE,
             token=token,
-            title="Your loan preview is ready",
-            description="Tap to view your personalised loan offer.",
-            image_url=DEFAULT_OG_IMAGE_URL,
-            theme_color=DEFAULT_THEME_COLOR,
             target_url=dest,
             canonical_url=dest,
             meta={"lender": lender, "mobile": mobile, "campaign_id": campaign_id, "fallback": True},
         )
 
-    return RedirectPreview(
+    return replace(
+        skel,
         token=token,
-        title=cfg.get("title", f"Your {lender} loan preview is ready"),
-        description=cfg.get("description", ""),
-        image_url=cfg.get("image_url", DEFAULT_OG_IMAGE_URL),
-        theme_color=cfg.get("theme_color", DEFAULT_THEME_COLOR),
         target_url=dest,
         canonical_url=dest,
         meta={"lender": lender, "mobile": mobile, "campaign_id": campaign_id},
     )
+
+
+def get_redirect_preview(token: Optional[str]) -> Optional[RedirectPreview]:
+    token = _clean_token(token)
+    if not token:
+        return None
+
+    row = _dab_lookup(token)
+    if not row:
+        return None
+
+    return _build_preview(token, row)
+
+
+async def aget_redirect_preview(token: Optional[str]) -> Optional[RedirectPreview]:
+    """Async variant of get_redirect_preview for async function handlers."""
+    if httpx is None:
+        return await asyncio.to_thread(get_redirect_preview, token)
+
+    token = _clean_token(token)
+    if not token:
+        return None
+
+    row = await _adab_lookup(token)
+    if not row:
+        return None
+
+    return _build_preview(token, row)
+
+# -----------------------------------------------------
+# PACKAGED LENDER CONFIGS (LOADED ONCE AT IMPORT)
+# -----------------------------------------------------
+
+# The lender JSONs ship with the deployment and never change while a worker
+# is alive, so read them all during worker init: request-time lookups are a
+# single dict probe and never touch the filesystem, hit or miss.
+
+def _load_all_lenders() -> Dict[str, LenderCfg]:
+    out = {}
+    # glob() of a missing directory just yields nothing; no is_dir() stat
+    for path in LENDER_JSON_DIR.glob("*_default.json"):
+        norm = path.stem[:-len("_default")]
+        try:
+            out[norm] = _lender_cfg(_read_json_file(str(path)))
+        except:
+            logging.exception("[Purview] Failed loading lender JSON: %s", path)
+
+    if not out:
+        logging.warning("[Purview] No lender JSON found in %s", LENDER_JSON_DIR)
+    return out
+
+def _load_fallback_config() -> Optional[Dict[str, Any]]:
+    try:
+        return _read_json_file(FALLBACK_JSON_PATH)
+    except FileNotFoundError:
+        logging.warning("[Purview] Missing fallback JSON: %s", FALLBACK_JSON_PATH)
+    except:
+        logging.exception("[Purview] Failed loading fallback JSON: %s", FALLBACK_JSON_PATH)
+    return None
+
+
+def _build_lender_skeletons() -> Dict[str, RedirectPreview]:
+    # One frozen preview per lender holding the static OG fields; requests
+    # clone it with replace() so the strings are shared, not copied
+    return {
+        norm: RedirectPreview(
+            token="",
+            title=cfg.title,
+            description=cfg.description,
+            image_url=cfg.image_url,
+            theme_color=cfg.theme_color,
+            target_url="",
+            canonical_url="",
+        )
+        for norm, cfg in _LENDER_TABLE.items()
+    }
+
+
+_LENDER_TABLE = MappingProxyType(_load_all_lenders())
+_LENDER_SKELETON = MappingProxyType(_build_lender_skeletons())
+_FALLBACK_CONFIG = _load_fallback_config()
@@ -1,42 +1,46 @@
 # shared/models.py
 
+from dataclasses import asdict, dataclass
+from typing import Optional, Union
+
+
+@dataclass(slots=True, frozen=True)
+class DabRow:
+    """The fields Purview reads from a DAB redirects row."""
+
+    destination_url: str
+    lender: str
+    mobile: Optional[str] = None
+    campaign_id: Optional[Union[str, int]] = None  # DAB may send either
+
+
+@dataclass(slots=True, frozen=True)
 class RedirectPreview:
     """
     RedirectPreview represents the fully resolved purview result:
     - Static lender metadata (title, description, image_url, theme_color)
     - Dynamic redirect fields (destination_url, canonical_url)
     - Extra metadata (lender, mobile, campaign_id, etc.)
+
+    Fields cannot be reassigned once built (per-lender skeletons are cloned
+    with dataclasses.replace). meta is still a plain dict, so instances are
+    not hashable and meta must not be mutated in place.
     """
 
-    def __init__(
-        self,
-        token: str,
-        title: str,
-        description: str,
-        image_url: str,
-        theme_color: str,
-        target_url: str,
-        canonical_url: str,
-        meta: dict | None = None,
-    ):
-        self.token = token
-        self.title = title
-        self.description = description
-        self.image_url = image_url
-        self.theme_color = theme_color
-        self.target_url = target_url
-        self.canonical_url = canonical_url
-        self.meta = meta or {}
+    token: str
+    title: str
+    description: str
+    image_url: str
+    theme_color: str
+    target_url: str
+    canonical_url: str
+    meta: Optional[dict] = None
+
+    def __post_init__(self):
+        # same as the old constructor: a missing meta becomes {}
+        if not self.meta:
+            object.__setattr__(self, "meta", {})
 
     def to_dict(self):
         """Optional helper for JSON debugging."""
-        return {
-            "token": self.token,
-            "title": self.title,
-            "description": self.description,
-            "image_url": self.image_url,
-            "theme_color": self.theme_color,
-            "target_url": self.target_url,
-            "canonical_url": self.canonical_url,
-            "meta": self.meta,
-        }
+        return asdict(self)
@@ -0,0 +1,9 @@
+import os
+import sys
+from pathlib import Path
+
+# shared.db_access reads its config at import: skip the background DAB
+# warm-up so tests never touch the network
+os.environ.setdefault("DAB_WARMUP", "0")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
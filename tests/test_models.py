@@ -0,0 +1,34 @@
+import dataclasses
+
+import pytest
+
+from shared.models import RedirectPreview
+
+
+def _preview(**kw):
+    fields = dict(
+        token="t",
+        title="title",
+        description="desc",
+        image_url="https://img.example/og.png",
+        theme_color="#000000",
+        target_url="https://lender.example",
+        canonical_url="https://lender.example",
+    )
+    fields.update(kw)
+    return RedirectPreview(**fields)
+
+
+@pytest.mark.parametrize("meta", [None, {}])
+def test_missing_meta_becomes_empty_dict(meta):
+    assert _preview(meta=meta).meta == {}
+    assert _preview().meta == {}
+
+
+def test_meta_is_not_shared_between_instances():
+    assert _preview().meta is not _preview().meta
+
+
+def test_fields_cannot_be_reassigned():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        _preview().title = "other"
@@ -0,0 +1,89 @@
+import asyncio
+
+import azure.functions as func
+import pytest
+
+import purview_preview as handler
+from shared.cache import ClockCache
+from shared.models import RedirectPreview
+
+
+PREVIEW = RedirectPreview(
+    token="tok123",
+    title="Your DMI loan preview is ready",
+    description="Tap to view",
+    image_url="https://img.example/dmi.png",
+    theme_color="#123456",
+    target_url="https://lender.example/apply",
+    canonical_url="https://lender.example/apply",
+    meta={"lender": "DMI"},
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(handler, "_preview_cache", ClockCache(16, handler.PREVIEW_CACHE_TTL))
+
+
+class FakeLookup:
+    def __init__(self, preview):
+        self.preview = preview
+        self.calls = []
+
+    async def __call__(self, token):
+        self.calls.append(token)
+        return self.preview
+
+
+@pytest.fixture
+def lookup(monkeypatch):
+    fake = FakeLookup(PREVIEW)
+    monkeypatch.setattr(handler, "aget_redirect_preview", fake)
+    return fake
+
+
+def _request(token):
+    return func.HttpRequest(
+        method="GET",
+        url=f"https://fn.example/api/p/{token}",
+        headers={"Host": "fn.example"},
+        route_params={"token": token},
+        body=b"",
+    )
+
+
+def _call(token):
+    return asyncio.run(handler.main(_request(token)))
+
+
+def test_miss_renders_and_caches_page(lookup):
+    resp = _call("tok123")
+
+    assert resp.status_code == 200
+    assert lookup.calls == ["tok123"]
+    body = resp.get_body()
+    assert b"Your DMI loan preview is ready" in body
+    assert b"https://fn.example/api/purview-image/dmi" in body
+    assert handler._get_cached_preview("tok123") == (body, resp.headers["ETag"])
+
+
+def test_hit_serves_cached_bytes_without_lookup(lookup):
+    first = _call("tok123")
+    second = _call("tok123")
+
+    assert lookup.calls == ["tok123"]
+    assert second.get_body() == first.get_body()
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["Cache-Control"] == "public, max-age=60"
+
+
+def test_fallback_page_is_not_cached(lookup):
+    lookup.preview = None
+
+    first = _call("tok123")
+    _call("tok123")
+
+    assert first.status_code == 200
+    assert b"https://r.duitai.in/p/tok123" in first.get_body()
+    assert lookup.calls == ["tok123", "tok123"]
+    assert handler._get_cached_preview("tok123") is None